@@ -0,0 +1,209 @@
+import asyncio
+import functools
+import logging
+import os
+import time
+
+import orjson
+from azure.storage.blob.aio import BlobServiceClient
+
+from ..events.event_publisher import EventPublisher
+from ..models import Error, HealthCheckResponse
+from ..storage.base_conversation_store import ConversationStore
+
+# The healthy payload never changes, so build and serialize it once.
+_HEALTHY = HealthCheckResponse(status="healthy").model_dump(exclude_none=True)
+_HEALTHY_BYTES = orjson.dumps(_HEALTHY) + b"\n"
+
+
+@functools.lru_cache(maxsize=32)
+def _unhealthy_response(code: str, message: str) -> tuple[dict, bytes]:
+    """Build the (payload, body bytes) pair for an unhealthy result once per error."""
+    payload = HealthCheckResponse(
+        status="unhealthy",
+        error=Error(code=code, message=message),
+    ).model_dump()
+    return payload, orjson.dumps(payload) + b"\n"
+
+
+class HealthHandler:
+    """
+    Health checks for the server's downstream dependencies.
+
+    All configured dependencies are probed concurrently so the worst-case
+    latency is a single probe timeout instead of the sum of all probes.
+
+    Results are cached for a short, configurable window (HEALTH_CACHE_TTL,
+    default 1 second) so bursty orchestrator probes do not fan out to the
+    downstream services on every request. Unhealthy results expire sooner
+    so recovery is detected quickly.
+
+    https://learn.microsoft.com/en-us/azure/container-apps/health-probes
+    """
+
+    PROBE_TIMEOUT = 5
+    # Skip the active RPC when real traffic confirmed the dependency this
+    # recently (seconds)
+    IDLE_PROBE_THRESHOLD = 10.0
+
+    def __init__(
+        self,
+        conversations_store: ConversationStore | None,
+        blob_service_client: BlobServiceClient | None,
+        event_publisher: EventPublisher | None,
+        logger: logging.Logger,
+    ):
+        self.conversations_store = conversations_store
+        self.blob_service_client = blob_service_client
+        self.event_publisher = event_publisher
+        self.logger = logger
+
+        self._store_always_healthy = bool(
+            getattr(conversations_store, "always_healthy", False)
+        )
+
+        # Timestamps of the last successful real operation per dependency;
+        # recent traffic is a liveness signal, so probes only issue fresh
+        # RPCs when the system has been idle
+        self.last_ok: dict[str, float] = {
+            "conversations_store": 0.0,
+            "blob_storage": 0.0,
+            "event_hub": 0.0,
+        }
+
+        self._cache: tuple[float, tuple[dict, int]] | None = None
+        self._cache_ttl = float(os.getenv("HEALTH_CACHE_TTL", "1.0"))
+        # Fail fast: expire unhealthy results sooner than healthy ones
+        self._unhealthy_cache_ttl = min(self._cache_ttl, 0.25)
+        self._inflight: asyncio.Future[tuple[dict, int]] | None = None
+
+    def record_ok(self, code: str):
+        """Record a successful real operation against a dependency."""
+        self.last_ok[code] = time.monotonic()
+
+    def _recently_ok(self, code: str) -> bool:
+        return time.monotonic() - self.last_ok[code] < self.IDLE_PROBE_THRESHOLD
+
+    async def _check_store(self) -> Error | None:
+        """Check conversations store (CosmosDB or in-memory)."""
+        if self._recently_ok("conversations_store"):
+            return None
+        try:
+            # Stores flagged as always healthy (e.g. in-memory) need no probe
+            if self._store_always_healthy:
+                pass
+            else:
+                # Try a simple list operation (should raise if CosmosDB is unreachable or misconfigured)
+                await asyncio.wait_for(
+                    self.conversations_store.list(active=None),
+                    timeout=self.PROBE_TIMEOUT,
+                )
+                self.record_ok("conversations_store")
+        except Exception as e:
+            self.logger.error(
+                f"Health check failed: Conversations store unhealthy: {e}"
+            )
+            return Error(
+                code="conversations_store",
+                message=f"Conversations store is unhealthy. {str(e)}.",
+            )
+        return None
+
+    async def _check_blob(self) -> Error | None:
+        """Check Azure Blob Storage."""
+        if self._recently_ok("blob_storage"):
+            return None
+        try:
+            # get_service_properties is a lightweight call
+            await asyncio.wait_for(
+                self.blob_service_client.get_service_properties(),
+                timeout=self.PROBE_TIMEOUT,
+            )
+            self.record_ok("blob_storage")
+        except Exception as e:
+            self.logger.error(f"Health check failed: Blob Storage unhealthy: {e}")
+            return Error(
+                code="blob_storage",
+                message=f"Blob storage is unhealthy. {str(e)}.",
+            )
+        return None
+
+    async def _check_eventhub(self) -> Error | None:
+        """Check Azure Event Hub."""
+        if self._recently_ok("event_hub"):
+            return None
+        try:
+            # ping issues a batch creation (does not send, but checks
+            # connection/permissions) at most once per interval
+            await asyncio.wait_for(
+                self.event_publisher.ping(),
+                timeout=self.PROBE_TIMEOUT,
+            )
+            self.record_ok("event_hub")
+        except Exception as e:
+            self.logger.error(f"Health check failed: Event Hub unhealthy: {e}")
+            return Error(
+                code="event_hub",
+                message=f"Event Hub is unhealthy. {str(e)}.",
+            )
+        return None
+
+    def _cached_result(self) -> tuple[dict, int] | None:
+        """Return the cached result if it has not expired yet."""
+        if self._cache is None:
+            return None
+
+        cached_at, result = self._cache
+        ttl = self._cache_ttl if result[1] == 200 else self._unhealthy_cache_ttl
+        if time.monotonic() - cached_at < ttl:
+            return result
+        return None
+
+    async def health_check(self) -> tuple[dict, int]:
+        """Report health, serving cached results within the TTL window."""
+        if result := self._cached_result():
+            return result
+
+        # Single-flight: if a refresh is already in progress, await its
+        # result instead of starting another probe fanout.
+        if self._inflight is not None:
+            return await asyncio.shield(self._inflight)
+
+        self._inflight = asyncio.get_running_loop().create_future()
+        try:
+            result = await self._run_probes()
+            self._cache = (time.monotonic(), result)
+            self._inflight.set_result(result)
+            return result
+        except BaseException as e:
+            self._inflight.set_exception(e)
+            raise
+        finally:
+            self._inflight = None
+
+    async def _run_probes(self) -> tuple[dict, int]:
+        """Probe all configured dependencies concurrently and report health."""
+        probes = [self._check_store()]
+
+        if self.blob_service_client:
+            probes.append(self._check_blob())
+
+        if self.event_publisher:
+            probes.append(self._check_eventhub())
+
+        # TODO check Azure Speech Service (if configured)
+
+        results = await asyncio.gather(*probes)
+
+        for error in results:
+            if error:
+                return _unhealthy_response(error.code, error.message)[0], 503
+
+        return _HEALTHY, 200
+
+    async def health_check_bytes(self) -> tuple[bytes, int]:
+        """Serialized variant of health_check for the ASGI interceptor."""
+        payload, status = await self.health_check()
+        if error := payload.get("error"):
+            return _unhealthy_response(error["code"], error["message"])[1], status
+        return _HEALTHY_BYTES, status
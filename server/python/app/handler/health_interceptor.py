@@ -0,0 +1,65 @@
+from typing import Iterable
+
+B_NOT_READY = b'{"status":"unhealthy"}\n'
+
+
+class HealthCheckInterceptor:
+    """
+    ASGI wrapper that answers health probe requests before they enter
+    Quart's routing and middleware stack.
+
+    Orchestrator probes arrive many times per second across replicas;
+    short-circuiting them at the ASGI layer avoids per-request routing,
+    request/response parsing, and middleware overhead. All other traffic
+    (including lifespan and websocket scopes) is passed through untouched.
+    """
+
+    def __init__(
+        self,
+        app,
+        server,
+        paths: Iterable[str] = ("/healthz", "/readyz"),
+    ):
+        self.app = app
+        self.server = server
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] != "GET":
+            await self._send_response(
+                send, 405, b"", extra_headers=[(b"allow", b"GET")]
+            )
+            return
+
+        # The handler is wired up during lifespan startup; probes arriving
+        # before that are answered with a plain 503.
+        health_handler = self.server.health_handler
+        if health_handler is None:
+            await self._send_response(send, 503, B_NOT_READY)
+            return
+
+        body, status = await health_handler.health_check_bytes()
+        await self._send_response(send, status, body)
+
+    async def _send_response(
+        self,
+        send,
+        status: int,
+        body: bytes,
+        extra_headers: list[tuple[bytes, bytes]] | None = None,
+    ):
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        if extra_headers:
+            headers.extend(extra_headers)
+
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -1,21 +1,66 @@
 import asyncio
+import functools
+import logging
 import os
+from typing import Any, Awaitable, Callable
 from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
 from semantic_kernel.contents import ChatHistorySummarizationReducer
 from semantic_kernel.kernel import Kernel
 import yaml
 
+
+@functools.lru_cache(maxsize=4)
+def _load_config(config_path: str) -> dict:
+    """Read and parse the YAML config once per path; sessions share the result."""
+    with open(config_path, 'r') as f:
+        return yaml.safe_load(f)
+
+
+logger = logging.getLogger(__name__)
+
+
 class AgentAssistant():
     """Agent Assist maintains conversational context and create summary, and performs RAG against a user-supplied domain knowledge base."""
 
-    def __init__(self, config_path: str):
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
-
-        self.kernel = self.initialize_kernel()
+    # Kernel and chat-completion service shared across sessions; only the
+    # reducer and message buffer hold per-session state.
+    _SHARED_KERNEL: Kernel | None = None
+
+    # Force a summarization pass when the buffer grows past this many
+    # characters, so it stays bounded even with a large summary_interval
+    MAX_BUFFER_CHARS = 8192
+
+    # Bursts of short fragments crossing the threshold collapse into a
+    # single LLM call instead of one per crossing
+    DEBOUNCE_SECONDS = 0.8
+
+    # One instance per active call; slots shrink the per-session footprint
+    # and make attribute reads a C-level slot lookup
+    __slots__ = (
+        "config",
+        "kernel",
+        "reducer",
+        "message_buffer",
+        "_buffer_chars",
+        "on_summary",
+        "_debounce_handle",
+        "_llm_lock",
+        "_work_queue",
+        "_worker_task",
+    )
+
+    def __init__(self, config_path: str, kernel: Kernel | None = None):
+        self.config = _load_config(config_path)
+
+        self.kernel = kernel if kernel is not None else self.get_kernel()
+        target_count = self.config.get('reducer_threshold', 5)
         self.reducer = ChatHistorySummarizationReducer(
             service=self.kernel.get_service(service_id="chat-completion"),
-            target_count=self.config.get('reducer_threshold', 5),
+            target_count=target_count,
+            # Defer reduction until the history doubles: between reductions
+            # every prompt is the previous one plus the newly appended turn,
+            # keeping the prefix stable for the backend's prompt cache.
+            threshold_count=target_count,
             auto_reduce=True
         )
         self.reducer.add_system_message("""You are an Agent Assist who receives transcription from both Agent and Customer.
@@ -27,36 +72,93 @@ class AgentAssistant():
         Do NOT simulate customer responses or continue the dialogue.
         Do NOT suggest what the customer might say next.
         """)
-        self.message_buffer = []
-
-        # Load configuration from environment
-        self.aoai_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-        self.aoai_deployment = os.getenv("AZURE_OPENAI_MODEL_DEPLOYMENT")
-        self.aoai_key = os.getenv("AZURE_OPENAI_KEY")
-    
-    def initialize_kernel(self):
-        kernel = Kernel()
-        kernel.add_service(AzureChatCompletion(
-            deployment_name=self.aoai_deployment,  
-            api_key=self.aoai_key,
-            endpoint=self.aoai_endpoint,
-            service_id="chat-completion"
-        ))
-        return kernel
-
-    async def on_transcription(self, fragment: str) -> str | None:
+        self.message_buffer: list[str] = []
+        self._buffer_chars = 0
+
+        # Awaited with each debounced summary; set by the session owner
+        self.on_summary: Callable[[Any], Awaitable[None]] | None = None
+        self._debounce_handle: asyncio.TimerHandle | None = None
+        self._llm_lock = asyncio.Lock()
+        # Single consumer with a one-slot queue: at most one LLM call in
+        # flight per session, and bursts coalesce into one pending signal
+        self._work_queue: asyncio.Queue[None] = asyncio.Queue(maxsize=1)
+        self._worker_task: asyncio.Task | None = None
+
+    @classmethod
+    def get_kernel(cls) -> Kernel:
+        """Build the shared kernel lazily on first use and reuse it afterwards."""
+        if cls._SHARED_KERNEL is None:
+            kernel = Kernel()
+            kernel.add_service(AzureChatCompletion(
+                deployment_name=os.getenv("AZURE_OPENAI_MODEL_DEPLOYMENT"),
+                api_key=os.getenv("AZURE_OPENAI_KEY"),
+                endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+                service_id="chat-completion"
+            ))
+            cls._SHARED_KERNEL = kernel
+        return cls._SHARED_KERNEL
+
+    async def on_transcription(self, fragment: str) -> None:
         self.message_buffer.append(fragment)
+        self._buffer_chars += len(fragment)
+
+        if (
+            len(self.message_buffer) < self.config['summary_interval']
+            and self._buffer_chars < self.MAX_BUFFER_CHARS
+        ):
+            return  # Not ready yet
+
+        # Debounce: reschedule on every threshold crossing so a burst of
+        # fragments produces one summarization instead of one per crossing
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+        self._debounce_handle = asyncio.get_running_loop().call_later(
+            self.DEBOUNCE_SECONDS, self._fire
+        )
 
-        if len(self.message_buffer) < self.config['summary_interval']:
-            print(f"current buffer size {len(self.message_buffer)}")
-            return None  # Not ready yet
-
-        return await self.invoke_llm()
+    def _fire(self) -> None:
+        self._debounce_handle = None
+        if self._worker_task is None:
+            self._worker_task = asyncio.get_running_loop().create_task(
+                self._assist_worker()
+            )
+        try:
+            self._work_queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # A pass is already pending; it will pick up the latest buffer
+            pass
+
+    async def _assist_worker(self) -> None:
+        """Drain summarization signals one at a time for this session."""
+        while True:
+            await self._work_queue.get()
+            try:
+                await self._summarize()
+            except Exception:
+                logger.exception("Agent assist summarization failed")
+            finally:
+                self._work_queue.task_done()
+
+    async def _summarize(self) -> None:
+        async with self._llm_lock:
+            summary = await self.invoke_llm()
+        if summary and self.on_summary:
+            await self.on_summary(summary)
 
     async def flush_summary(self) -> str | None:
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self._debounce_handle = None
+        if self._worker_task is not None:
+            # Let any pending pass finish, then retire the worker
+            await self._work_queue.join()
+            self._worker_task.cancel()
+            self._worker_task = None
+
         result = None
         if self.message_buffer:
-            result = await self.invoke_llm()
+            async with self._llm_lock:
+                result = await self.invoke_llm()
 
         # Optionally, print final context
         # print('\n@ Stored messages - ')
@@ -64,12 +166,19 @@ class AgentAssistant():
         #     print(f"{msg.role} - {msg.content}")
 
         return result
-    
+
     async def invoke_llm(self) -> str | None:
+        # A debounced fire can race with flush_summary; whoever runs first
+        # drains the buffer and the other becomes a no-op
+        if not self.message_buffer:
+            return None
+
         # Build user input
         user_input = "Transcriptions:\n" + ' '.join(self.message_buffer)
-        print(f"input {user_input}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"input {user_input}")
         self.message_buffer.clear()
+        self._buffer_chars = 0
 
         self.reducer.add_user_message(user_input)
 
@@ -92,6 +201,7 @@ class AgentAssistant():
         )
         if response:
             self.reducer.add_message(response.value[0])
-            print(f"response: {response.value[0]} \n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"response: {response.value[0]}")
             return response.value[0]
         return None
\ No newline at end of file
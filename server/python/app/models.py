@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any
+from typing import Any, Callable
 
 import azure.cognitiveservices.speech as speechsdk
 from pydantic import BaseModel, ConfigDict, Field
@@ -59,6 +59,11 @@ class WebSocketSessionStorage(BaseModel):
     client_seq: int = 0
     server_seq: int = 0
     conversation_id: str | None = None
+    # Media format negotiated in the open transaction, cached here so the
+    # per-frame audio path does not have to fetch the conversation
+    media: dict[str, Any] | None = None
+    # Reused payload for pong replies, the highest-frequency server message
+    pong_template: dict[str, Any] | None = None
     # Provider-specific speech session storage
     speech_session: Any | None = None
 
@@ -88,7 +93,12 @@ class AzureAISpeechSession(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     audio_buffer: speechsdk.audio.PushAudioInputStream
-    raw_audio: bytearray
+    # Bound write method of audio_buffer, captured once so the per-frame
+    # path skips the attribute chain
+    write_audio: Callable[[bytes], Any]
     media: dict[str, Any]
+    # End timestamp of the most recent finalized utterance, used when a
+    # debounced summary lands after the fragment that triggered it
+    last_end: str | None = None
     recognize_task: asyncio.Task
     assist: AgentAssistant
@@ -1,10 +1,10 @@
 import asyncio
-import json
 import logging
 import os
-from typing import Any, Awaitable, Callable, cast
+from typing import Any, Awaitable, Callable
 
 import azure.cognitiveservices.speech as speechsdk
+import orjson
 
 from ..enums import AzureGenesysEvent
 from ..models import AzureAISpeechSession, TranscriptItem,SummaryItem, WebSocketSessionStorage
@@ -13,11 +13,48 @@ from ..utils.identity import get_speech_token
 from .speech_provider import SpeechProvider
 from ..language.agent_assist import AgentAssistant
 
+# Path to the agent-assist config, relative to this script's directory
+_ASSIST_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "../language/config.yaml"
+)
+
+
+def _await_sdk_future(sdk_future) -> Awaitable:
+    """Await a Speech SDK ResultFuture.
+
+    The SDK only exposes a blocking .get(), so it runs on the shared default
+    executor; asyncio.to_thread would additionally copy contextvars on every
+    call, which the SDK callback needs nothing from.
+    """
+    return asyncio.get_running_loop().run_in_executor(None, sdk_future.get)
+
+
+def _ticks_to_pt(ticks: int) -> str:
+    """Format 100ns SDK ticks as an ISO 8601 duration, e.g. PT1.23S."""
+    # Bias by half a hundredth so the result rounds like %.2f formatting
+    seconds, remainder = divmod(ticks + 50_000, 10_000_000)
+    return f"PT{seconds}.{remainder // 100_000:02d}S"
+
+
+def _normalize_transcript_text(text: str) -> str:
+    """Normalize transcript text by ensuring proper capitalization and punctuation."""
+    if not text:
+        return text
+    needs_upper = not text[0].isupper()
+    needs_dot = text[-1] not in ".!?"
+    if not needs_upper and not needs_dot:
+        return text
+    normalized = text[0].upper() + text[1:] if needs_upper else text
+    return normalized + "." if needs_dot else normalized
+
 class AzureAISpeechProvider(SpeechProvider):
     """Azure AI Speech implementation of SpeechProvider."""
 
     supported_languages: list[str] = []
 
+    # AAD speech tokens are valid for ~10 minutes; refresh a minute early
+    TOKEN_REFRESH_INTERVAL = 540
+
     def __init__(
         self,
         conversations_store: ConversationStore,
@@ -34,6 +71,17 @@ class AzureAISpeechProvider(SpeechProvider):
         self.speech_resource_id: str | None = os.getenv("AZURE_SPEECH_RESOURCE_ID")
         languages = os.getenv("AZURE_SPEECH_LANGUAGES", "en-US")
         self.supported_languages = languages.split(",") if languages else ["en-US"]
+        # Partial hypotheses fire dozens of times per second per stream and
+        # are only logged, so the callback is opt-in
+        self.emit_partials = os.getenv("AZURE_SPEECH_EMIT_PARTIALS") == "true"
+
+        # SpeechConfig construction involves a dozen property sets (and, in
+        # the keyless branch, an AAD round trip), so configs are cached per
+        # channel layout and the auth token refreshed on an interval instead
+        # of per session
+        self._config_cache: dict[tuple, speechsdk.SpeechConfig] = {}
+        self._speech_token: str | None = None
+        self._token_refresh_task: asyncio.Task | None = None
 
     async def initialize_session(
         self,
@@ -50,23 +98,21 @@ class AzureAISpeechProvider(SpeechProvider):
         )
 
         stream = speechsdk.audio.PushAudioInputStream(stream_format=audio_format)
-        # Get the absolute path to the provider.py script's directory
-        provider_script_dir = os.path.dirname(os.path.abspath(__file__))
 
-        # Calculate the path to the config file based on the provider.py's directory
-        config_path = os.path.join(provider_script_dir, "../language/config.yaml")
-
-        assist = AgentAssistant(config_path)
+        # The kernel and config are shared across sessions; only the reducer
+        # and message buffer inside the assistant are per-session.
+        assist = AgentAssistant(_ASSIST_CONFIG_PATH, kernel=AgentAssistant.get_kernel())
 
         ws_session.speech_session = AzureAISpeechSession(
             audio_buffer=stream,
-            raw_audio=bytearray(),
+            write_audio=stream.write,
             media=media,
             recognize_task=asyncio.create_task(
                 self._recognize_speech(session_id, ws_session)
             ),
             assist=assist,
         )
+        assist.on_summary = lambda summary: self._store_summary(ws_session, summary)
 
     async def handle_audio_frame(
         self,
@@ -75,14 +121,16 @@ class AzureAISpeechProvider(SpeechProvider):
         media: dict[str, Any],
         data: bytes,
     ) -> None:
-        """Feed incoming chunks into the push stream and raw buffer."""
-        if ws_session.speech_session is None:
+        """Feed incoming chunks into the push stream."""
+        speech_session = ws_session.speech_session
+        if speech_session is None:
             self.logger.error(f"[{session_id}] Session not initialized.")
             return
 
         try:
-            speech_session = cast(AzureAISpeechSession, ws_session.speech_session)
-            speech_session.audio_buffer.write(data)
+            # Bound method captured at session init; this is the per-packet
+            # hot path, so keep it to a single call
+            speech_session.write_audio(data)
         except Exception as ex:
             self.logger.error(f"[{session_id}] Write error: {ex}")
 
@@ -97,7 +145,7 @@ class AzureAISpeechProvider(SpeechProvider):
             return
 
         try:
-            speech_session = cast(AzureAISpeechSession, ws_session.speech_session)
+            speech_session = ws_session.speech_session
             speech_session.audio_buffer.close()
         except Exception as ex:
             self.logger.warning(f"[{session_id}] Close error: {ex}")
@@ -110,23 +158,33 @@ class AzureAISpeechProvider(SpeechProvider):
                 self.logger.error(f"[{session_id}] Recognition error: {ex}")
 
     async def close(self) -> None:
-        """No global cleanup needed for Azure Speech."""
-        return None
-
-    async def _recognize_speech(
-        self,
-        session_id: str,
-        ws_session: WebSocketSessionStorage,
-    ) -> None:
-        """
-        Configure SpeechRecognizer, wire callbacks, and drive the
-        continuous-recognition loop until the audio stream is closed.
-        """
-
-        speech_session = cast(AzureAISpeechSession, ws_session.speech_session)
-        media = speech_session.media
-        is_multichannel = bool(media.get("channels", []) and len(media["channels"]) > 1)
-
+        """Stop the background token refresh; no other global cleanup needed."""
+        if self._token_refresh_task:
+            self._token_refresh_task.cancel()
+            self._token_refresh_task = None
+
+    def _get_speech_config(self, is_multichannel: bool) -> speechsdk.SpeechConfig:
+        """Return the cached SpeechConfig for this channel layout."""
+        if not self.speech_key:
+            if self._speech_token is None:
+                self._speech_token = get_speech_token(self.speech_resource_id)
+            if self._token_refresh_task is None:
+                self._token_refresh_task = asyncio.create_task(
+                    self._refresh_speech_token()
+                )
+
+        key = (is_multichannel,)
+        speech_config = self._config_cache.get(key)
+        if speech_config is None:
+            speech_config = self._build_speech_config(is_multichannel)
+            self._config_cache[key] = speech_config
+        elif not self.speech_key:
+            # Inject the latest token into the cached config
+            speech_config.authorization_token = self._speech_token
+        return speech_config
+
+    def _build_speech_config(self, is_multichannel: bool) -> speechsdk.SpeechConfig:
+        """Construct and fully configure a SpeechConfig; called once per layout."""
         region = self.region
         endpoint = None
         if is_multichannel and region:
@@ -142,20 +200,15 @@ class AzureAISpeechProvider(SpeechProvider):
                 endpoint=endpoint,
             )
         else:
-            token = get_speech_token(self.speech_resource_id)
             speech_config = speechsdk.SpeechConfig(
-                auth_token=token,
+                auth_token=self._speech_token,
                 region=None if is_multichannel else region,
                 endpoint=endpoint,
             )
 
         if len(self.supported_languages) > 1:
             speech_config.speech_recognition_language = self.supported_languages[0]
-            auto_detect = None
         else:
-            auto_detect = speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-                languages=self.supported_languages
-            )
             speech_config.set_property(
                 speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode,
                 "Continuous",
@@ -168,6 +221,41 @@ class AzureAISpeechProvider(SpeechProvider):
         speech_config.set_property(
             speechsdk.PropertyId.Speech_SegmentationStrategy, "Semantic"
         )
+        return speech_config
+
+    async def _refresh_speech_token(self) -> None:
+        """Refresh the cached AAD speech token before it expires."""
+        while True:
+            await asyncio.sleep(self.TOKEN_REFRESH_INTERVAL)
+            try:
+                self._speech_token = await asyncio.to_thread(
+                    get_speech_token, self.speech_resource_id
+                )
+            except Exception as ex:
+                self.logger.error(f"Speech token refresh failed: {ex}")
+
+    async def _recognize_speech(
+        self,
+        session_id: str,
+        ws_session: WebSocketSessionStorage,
+    ) -> None:
+        """
+        Configure SpeechRecognizer, wire callbacks, and drive the
+        continuous-recognition loop until the audio stream is closed.
+        """
+
+        speech_session = ws_session.speech_session
+        media = speech_session.media
+        is_multichannel = bool(media.get("channels", []) and len(media["channels"]) > 1)
+
+        speech_config = self._get_speech_config(is_multichannel)
+
+        if len(self.supported_languages) > 1:
+            auto_detect = None
+        else:
+            auto_detect = speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
+                languages=self.supported_languages
+            )
 
         audio_in = speechsdk.audio.AudioConfig(stream=speech_session.audio_buffer)
         recognizer = speechsdk.SpeechRecognizer(
@@ -179,9 +267,16 @@ class AzureAISpeechProvider(SpeechProvider):
         loop = asyncio.get_running_loop()
         done_event = asyncio.Event()
 
-        recognizer.recognizing.connect(
-            lambda evt: loop.call_soon_threadsafe(self._on_recognizing, session_id, evt)
-        )
+        if self.emit_partials:
+            # The isEnabledFor check runs on the SDK thread so disabled INFO
+            # logging skips the thread hop and f-string formatting entirely
+            recognizer.recognizing.connect(
+                lambda evt: loop.call_soon_threadsafe(
+                    self._on_recognizing, session_id, evt
+                )
+                if self.logger.isEnabledFor(logging.INFO)
+                else None
+            )
         recognizer.recognized.connect(
             lambda evt: loop.call_soon_threadsafe(
                 self._on_recognized,
@@ -199,9 +294,9 @@ class AzureAISpeechProvider(SpeechProvider):
         )
 
         self.logger.info(f"[{session_id}] Starting continuous recognition.")
-        await asyncio.to_thread(recognizer.start_continuous_recognition_async().get)
+        await _await_sdk_future(recognizer.start_continuous_recognition_async())
         await done_event.wait()
-        await asyncio.to_thread(recognizer.stop_continuous_recognition_async().get)
+        await _await_sdk_future(recognizer.stop_continuous_recognition_async())
         self.logger.info(f"[{session_id}] Recognition stopped.")
 
     def _on_recognizing(
@@ -219,66 +314,82 @@ class AzureAISpeechProvider(SpeechProvider):
         evt: speechsdk.SpeechRecognitionEventArgs,
     ) -> None:
         """Handle final recognition, update store, and emit partial transcript."""
-        result = json.loads(evt.result.json)
-        status = result.get("RecognitionStatus")
-
-        if status == "InitialSilenceTimeout":
-            self.logger.warning(f"[{session_id}] Initial silence timeout.")
+        # Status, offset, and duration are available as plain attributes on
+        # the SDK result; only the multichannel path needs the JSON payload
+        # (for the Channel field), and orjson parses it faster than json.
+        if evt.result.reason == speechsdk.ResultReason.NoMatch:
+            self.logger.warning(
+                f"[{session_id}] No match: {evt.result.no_match_details}"
+            )
             return
 
-        def normalize_transcript_text(text: str) -> str:
-            """Normalize transcript text by ensuring proper capitalization and punctuation."""
-            if text and text[-1] not in ".!?":
-                text = text[0].upper() + text[1:] + "."
-            elif text and not text[0].isupper():
-                text = text[0].upper() + text[1:]
-            return text
-
-        text = normalize_transcript_text(evt.result.text)
-
-        offset = result.get("Offset", 0)
-        duration = result.get("Duration", 0)
-        start = f"PT{offset / 10_000_000:.2f}S"
-        end = f"PT{(offset + duration) / 10_000_000:.2f}S"
-
-        channel = result.get("Channel") if is_multichannel else 1
-
-        # print(f"channel: {channel}, text: {text}, start: {start}, end:{end}")
-        item = TranscriptItem(
-            channel=channel,
-            text=text,
-            start=start,
-            end=end,
-        )
+        text = _normalize_transcript_text(evt.result.text)
 
-        async def _update() -> None:
-            await self.conversations_store.append_transcript(
-                ws_session.conversation_id, item
-            )
+        offset = evt.result.offset
+        duration = evt.result.duration
+        start = _ticks_to_pt(offset)
+        end = _ticks_to_pt(offset + duration)
+
+        if is_multichannel:
+            channel = orjson.loads(evt.result.json).get("Channel")
+        else:
+            channel = 1
 
-        asyncio.run_coroutine_threadsafe(_update(), loop)
+        # One dict serves as both the event payload and the TranscriptItem
+        # fields; model_construct skips pydantic validation since every
+        # field is already the right type.
+        payload = {"channel": channel, "text": text, "start": start, "end": end}
+        item = TranscriptItem.model_construct(**payload)
+
+        # Submit all follow-up work as one coroutine so the loop is woken
+        # once per finalized utterance instead of once per task.
         asyncio.run_coroutine_threadsafe(
+            self._handle_recognized(session_id, ws_session, item, payload), loop
+        ).add_done_callback(self._log_background_error)
+
+    async def _handle_recognized(
+        self,
+        session_id: str,
+        ws_session: WebSocketSessionStorage,
+        item: TranscriptItem,
+        payload: dict[str, Any],
+    ) -> None:
+        """Persist a finalized utterance and fan out the follow-up work."""
+        await self.conversations_store.append_transcript(
+            ws_session.conversation_id, item
+        )
+        await asyncio.gather(
             self.send_event(
                 event=AzureGenesysEvent.PARTIAL_TRANSCRIPT,
                 session_id=session_id,
-                message=item.model_dump(),
+                message=payload,
             ),
-            loop,
+            self._assist(ws_session, item.text, item.end),
         )
 
-        async def _assist(end:str):
-            speech_session = cast(AzureAISpeechSession, ws_session.speech_session)
-            if speech_session.assist:
-                summary = await speech_session.assist.on_transcription(text)
-                if summary:
-                    summaryItem = SummaryItem(
-                        text=summary.content,
-                        transcription_end=end,
-                    )
-                    await self.conversations_store.append_summary( ws_session.conversation_id, summaryItem)
-             
-
-        asyncio.run_coroutine_threadsafe(_assist(end), loop)
+    async def _assist(
+        self,
+        ws_session: WebSocketSessionStorage,
+        text: str,
+        end: str | None,
+    ) -> None:
+        """Feed a finalized utterance to agent assist; summaries arrive
+        asynchronously via the debounced on_summary callback."""
+        speech_session = ws_session.speech_session
+        if speech_session.assist:
+            speech_session.last_end = end
+            await speech_session.assist.on_transcription(text)
+
+    async def _store_summary(self, ws_session: WebSocketSessionStorage, summary) -> None:
+        """Persist a debounced agent-assist summary."""
+        speech_session = ws_session.speech_session
+        summaryItem = SummaryItem(
+            text=summary.content,
+            transcription_end=speech_session.last_end,
+        )
+        await self.conversations_store.append_summary(
+            ws_session.conversation_id, summaryItem
+        )
 
     def _on_session_stopped(
         self,
@@ -289,7 +400,7 @@ class AzureAISpeechProvider(SpeechProvider):
         evt: speechsdk.SessionEventArgs,
     ) -> None:
         async def _flush_summary():
-            speech_session = cast(AzureAISpeechSession, ws_session.speech_session)
+            speech_session = ws_session.speech_session
             if hasattr(speech_session, "assist") and speech_session.assist:
                 summary = await speech_session.assist.flush_summary()
 
@@ -300,8 +411,19 @@ class AzureAISpeechProvider(SpeechProvider):
                     )
                     await self.conversations_store.append_summary( ws_session.conversation_id, summaryItem)
 
-        asyncio.run_coroutine_threadsafe(_flush_summary(), loop)
+        asyncio.run_coroutine_threadsafe(_flush_summary(), loop).add_done_callback(
+            self._log_background_error
+        )
 
         """Signal that continuous recognition has finished."""
         self.logger.info(f"[{session_id}] Session stopped: {evt.session_id}")
-        done_event.set()
\ No newline at end of file
+        done_event.set()
+
+    def _log_background_error(self, future) -> None:
+        """Surface exceptions from fire-and-forget recognition follow-ups.
+
+        concurrent.futures.Future drops unretrieved exceptions silently, so
+        failures in the store/event/assist path would otherwise vanish.
+        """
+        if not future.cancelled() and (exc := future.exception()):
+            self.logger.error(f"Recognition follow-up failed: {exc}")
\ No newline at end of file
@@ -117,7 +117,6 @@ class AzureOpenAIGPT4oTranscriber(SpeechProvider):
             }
         else:
             headers = {"Authorization": f"Bearer {get_access_token().token}"}
-            print(f"WebSocket headers: {headers}")
 
         async def create_ws_and_task(channel: int):
             ws = await websockets.connect(ws_url, additional_headers=headers)
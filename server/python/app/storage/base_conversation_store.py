@@ -8,6 +8,10 @@ class ConversationStore:
     getting, setting, deleting, and listing conversations.
     """
 
+    # Stores that cannot fail (e.g. in-memory) set this to True so health
+    # checks can skip probing them.
+    always_healthy: bool = False
+
     async def get(self, conversation_id: str) -> Conversation | None:
         raise NotImplementedError
 
@@ -33,6 +37,10 @@ class ConversationStore:
         """Set the 'active' status of a conversation."""
         raise NotImplementedError
 
+    async def finalize(self, conversation_id: str, *, active: bool = False):
+        """Apply the final end-of-session state in a single update."""
+        raise NotImplementedError
+
     async def append_rtt(self, conversation_id: str, rtt: str):
         """Append an RTT entry to the conversation's rtt list."""
         raise NotImplementedError
@@ -103,6 +103,16 @@ class CosmosDBConversationStore(ConversationStore):
             patch_operations=[{"op": "replace", "path": "/active", "value": active}],
         )
 
+    async def finalize(self, conversation_id: str, *, active: bool = False):
+        """Persist the end-of-session state with a single patch operation."""
+        container = await self._get_container()
+
+        await container.patch_item(
+            conversation_id,
+            partition_key=conversation_id,
+            patch_operations=[{"op": "replace", "path": "/active", "value": active}],
+        )
+
     async def append_rtt(self, conversation_id: str, rtt: str):
         container = await self._get_container()
 
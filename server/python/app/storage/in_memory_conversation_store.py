@@ -6,9 +6,13 @@ class InMemoryConversationStore(ConversationStore):
     """
     In-memory implementation of the ConversationStore interface.
     This class is used for testing and development purposes.
-    It stores conversations in a dictionary.
+    It stores conversations in a plain dictionary without any locking;
+    all access happens on the event loop, so reads and writes are O(1)
+    unsynchronized dict operations.
     """
 
+    always_healthy = True
+
     def __init__(self):
         self._store = {}
 
@@ -41,6 +45,9 @@ class InMemoryConversationStore(ConversationStore):
             conversation.active = active
             await self.set(conversation)
 
+    async def finalize(self, conversation_id: str, *, active: bool = False):
+        await self.set_active(conversation_id, active)
+
     async def append_rtt(self, conversation_id: str, rtt: str):
         conversation = await self.get(conversation_id)
         if conversation:
@@ -48,14 +55,12 @@ class InMemoryConversationStore(ConversationStore):
             await self.set(conversation)
 
     async def append_transcript(self, conversation_id: str, item: TranscriptItem):
-        print(f"transcription: {item.model_dump()}\n")
         conversation = await self.get(conversation_id)
         if conversation:
             conversation.transcript.append(item)
             await self.set(conversation)
 
     async def append_summary(self, conversation_id: str, item: SummaryItem):
-        print(f"summary: {item.model_dump()}\n")
         conversation = await self.get(conversation_id)
         if conversation:
             conversation.summary.append(item)
@@ -1,12 +1,18 @@
 import asyncio
 import functools
-import json
+import hmac
 import logging
 import os
+import sys
 from typing import Any
 
+import aiohttp
+import orjson
+from azure.core.pipeline.transport import AioHttpTransport
+
 # Speech provider abstraction
 from azure.storage.blob.aio import BlobServiceClient
+from pydantic import TypeAdapter
 from quart import Quart, request, websocket, send_from_directory
 
 from .enums import (
@@ -17,11 +23,12 @@ from .enums import (
     ServerMessageType,
 )
 from .events.event_publisher import EventPublisher
+from .handler.health_handler import HealthHandler
+from .handler.health_interceptor import HealthCheckInterceptor
 from .models import (
     Conversation,
     ConversationsResponse,
-    Error,
-    HealthCheckResponse,
+    TranscriptItem,
     WebSocketSessionStorage,
 )
 from .speech.azure_ai_speech_provider import AzureAISpeechProvider
@@ -31,11 +38,36 @@ from .speech.azure_openai_gpt4o_transcriber import (
 from .speech.speech_provider import SpeechProvider
 from .storage.base_conversation_store import ConversationStore
 from .storage.conversation_store import get_conversation_store
-from .storage.in_memory_conversation_store import (
-    InMemoryConversationStore,
-)
 from .utils.identity import get_azure_credential_async
 
+# Module-level bindings avoid an attribute lookup per message
+_json_loads = orjson.loads
+_json_dumps = orjson.dumps
+
+# Synthetic conversation ID used by Genesys Cloud connection probes; interned
+# so the open/close comparisons short-circuit on identity
+CONNECTION_PROBE_ID = sys.intern("00000000-0000-0000-0000-000000000000")
+
+# Channel pair identifying a stereo (internal + external) media format
+_STEREO_CHANNELS = frozenset(("internal", "external"))
+
+
+# Cache credential env vars on first use (after dotenv has loaded) so each
+# websocket upgrade avoids the os.environ lookups.
+@functools.lru_cache(maxsize=1)
+def _ws_api_key() -> str:
+    return os.getenv("WEBSOCKET_SERVER_API_KEY") or ""
+
+
+@functools.lru_cache(maxsize=1)
+def _ws_client_secret() -> str:
+    return os.getenv("WEBSOCKET_SERVER_CLIENT_SECRET") or ""
+
+
+# Serializes the full transcript in pydantic-core (Rust) instead of a
+# per-item Python loop
+_TRANSCRIPT_ADAPTER = TypeAdapter(list[TranscriptItem])
+
 
 class WebsocketServer:
     """Websocket server class"""
@@ -43,8 +75,12 @@ class WebsocketServer:
     active_ws_sessions: dict[str, WebSocketSessionStorage] = {}
     logger: logging.Logger = logging.getLogger(__name__)
     blob_service_client: BlobServiceClient | None = None
+    _aiohttp_session: aiohttp.ClientSession | None = None
     conversations_store: ConversationStore | None = None
     event_publisher: EventPublisher | None = None
+    event_queue: asyncio.Queue | None = None
+    event_dispatcher_task: asyncio.Task | None = None
+    health_handler: HealthHandler | None = None
     speech_provider: SpeechProvider | None = None
 
     def __init__(self):
@@ -54,14 +90,36 @@ class WebsocketServer:
         self.app.before_serving(self.create_connections)
         self.app.after_serving(self.close_connections)
 
+        # ASGI entrypoint: answers /healthz and /readyz probes before
+        # they reach Quart's routing stack.
+        self.asgi_app = HealthCheckInterceptor(self.app, self)
+
+        # Hash-based dispatch for incoming client messages
+        self._message_dispatch = {
+            ClientMessageType.OPEN: self.handle_open_message,
+            ClientMessageType.PING: self.handle_ping_message,
+            ClientMessageType.UPDATE: self.handle_update_message,
+            ClientMessageType.CLOSE: self.handle_close_message,
+        }
+
     def require_api_key(self, func):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            api_key = os.getenv("WEBSOCKET_SERVER_API_KEY")
-            header_key = request.headers.get("X-Api-Key")
-            param_key = request.args.get("key")
-            if api_key and (header_key == api_key or param_key == api_key):
-                return await func(*args, **kwargs)
+            # Cached env lookup plus constant-time comparison on bytes
+            # (compare_digest rejects non-ASCII str); the query param is
+            # only read when the header does not match
+            api_key = _ws_api_key().encode()
+            if api_key:
+                header_key = request.headers.get("X-Api-Key")
+                if header_key is not None and hmac.compare_digest(
+                    header_key.encode(), api_key
+                ):
+                    return await func(*args, **kwargs)
+                param_key = request.args.get("key")
+                if param_key is not None and hmac.compare_digest(
+                    param_key.encode(), api_key
+                ):
+                    return await func(*args, **kwargs)
             return {
                 "error": {
                     "code": "unauthorized",
@@ -89,15 +147,33 @@ class WebsocketServer:
 
         self.app.route("/viewconversations")(self.require_api_key(self.serve_view))
 
+    def _create_blob_transport(self) -> AioHttpTransport:
+        """
+        Build a shared aiohttp transport with a generous keep-alive pool so
+        blob calls and health probes reuse TCP/TLS connections instead of
+        re-handshaking.
+        """
+        self._aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            )
+        )
+        # The session outlives the transport; it is closed in close_connections
+        return AioHttpTransport(session=self._aiohttp_session, session_owner=False)
+
     async def create_connections(self):
         """Create connections before serving"""
         if connection_string := os.getenv("AZURE_STORAGE_CONNECTION_STRING"):
             self.blob_service_client = BlobServiceClient.from_connection_string(
-                connection_string
+                connection_string, transport=self._create_blob_transport()
             )
         elif account_url := os.getenv("AZURE_STORAGE_ACCOUNT_URL"):
             self.blob_service_client = BlobServiceClient(
-                account_url, credential=get_azure_credential_async()
+                account_url,
+                credential=get_azure_credential_async(),
+                transport=self._create_blob_transport(),
             )
 
         self.conversations_store = get_conversation_store()
@@ -106,6 +182,12 @@ class WebsocketServer:
             "AZURE_EVENT_HUB_CONNECTION_STRING"
         ):
             self.event_publisher = EventPublisher()
+            # Events are queued and published in the background so
+            # client-facing acks are not delayed by Event Hub round trips
+            self.event_queue = asyncio.Queue(maxsize=1024)
+            self.event_dispatcher_task = asyncio.create_task(
+                self._event_dispatcher()
+            )
 
         if selected_speech_provider := os.getenv("SPEECH_PROVIDER", "azure-ai-speech"):
             if selected_speech_provider == "azure-ai-speech":
@@ -138,12 +220,26 @@ class WebsocketServer:
                 )
         self.logger.info(f"Speech provider set: {self.speech_provider}")
 
+        self.health_handler = HealthHandler(
+            self.conversations_store,
+            self.blob_service_client,
+            self.event_publisher,
+            self.logger,
+        )
+
     async def close_connections(self):
         """Close connections after serving"""
         if self.blob_service_client:
             await self.blob_service_client.close()
 
+        if self._aiohttp_session:
+            await self._aiohttp_session.close()
+
         if self.event_publisher:
+            if self.event_dispatcher_task:
+                # Drain queued events before shutting the publisher down
+                await self.event_queue.join()
+                self.event_dispatcher_task.cancel()
             await self.event_publisher.close()
 
         if self.conversations_store:
@@ -158,71 +254,7 @@ class WebsocketServer:
 
         https://learn.microsoft.com/en-us/azure/container-apps/health-probes
         """
-
-        # TODO abstract this to a health check class
-
-        # Check conversations store (CosmosDB or in-memory)
-        try:
-            # InMemoryConversationStore is always healthy
-            if isinstance(self.conversations_store, InMemoryConversationStore):
-                pass
-            else:
-                # Try a simple list operation (should raise if CosmosDB is unreachable or misconfigured)
-                await asyncio.wait_for(
-                    self.conversations_store.list(active=None), timeout=5
-                )
-        except Exception as e:
-            self.logger.error(
-                f"Health check failed: Conversations store unhealthy: {e}"
-            )
-
-            return HealthCheckResponse(
-                status="unhealthy",
-                error=Error(
-                    code="conversations_store",
-                    message=f"Conversations store is unhealthy. {str(e)}.",
-                ),
-            ).model_dump(), 503
-
-        # Check Azure Blob Storage (if configured)
-        if self.blob_service_client:
-            try:
-                # get_service_properties is a lightweight call
-                await asyncio.wait_for(
-                    self.blob_service_client.get_service_properties(), timeout=5
-                )
-            except Exception as e:
-                self.logger.error(f"Health check failed: Blob Storage unhealthy: {e}")
-
-                return HealthCheckResponse(
-                    status="unhealthy",
-                    error=Error(
-                        code="blob_storage",
-                        message=f"Blob storage is unhealthy. {str(e)}.",
-                    ),
-                ).model_dump(), 503
-
-        # Check Azure Event Hub (if configured)
-        if self.event_publisher:
-            try:
-                # Try to create a batch (does not send, but checks connection/permissions)
-                await asyncio.wait_for(
-                    self.event_publisher.producer_client.create_batch(), timeout=5
-                )
-            except Exception as e:
-                self.logger.error(f"Health check failed: Event Hub unhealthy: {e}")
-
-                return HealthCheckResponse(
-                    status="unhealthy",
-                    error=Error(
-                        code="event_hub",
-                        message=f"Event Hub is unhealthy. {str(e)}.",
-                    ),
-                ).model_dump(), 503
-
-        # TODO check Azure Speech Service (if configured)
-
-        return HealthCheckResponse(status="healthy").model_dump(exclude_none=True), 200
+        return await self.health_handler.health_check()
 
     async def get_conversations(self) -> Any:
         """
@@ -258,55 +290,52 @@ class WebsocketServer:
         """Websocket endpoint"""
         headers = websocket.headers
         remote = websocket.remote_addr
-        session_id = headers["Audiohook-Session-Id"]
 
+        # Validate headers before accepting so rejected traffic never pays
+        # for the websocket handshake
+        session_id = headers.get("Audiohook-Session-Id")
         if not session_id:
-            return await self.disconnect(
-                reason=DisconnectReason.ERROR,
-                message="No session ID provided",
-                code=1008,
-                session_id=None,
-            )
+            self.logger.warning("No session ID provided")
+            return await websocket.close(1008)
+
+        # Fail closed when no key is configured; constant-time comparison
+        # on bytes (compare_digest rejects non-ASCII str) to avoid leaking
+        # the key through timing
+        api_key = _ws_api_key()
+        if not api_key or not hmac.compare_digest(
+            headers.get("X-Api-Key", "").encode(), api_key.encode()
+        ):
+            self.logger.warning(f"[{session_id}] Invalid API Key")
+            return await websocket.close(3000)
 
-        if headers["X-Api-Key"] != os.getenv("WEBSOCKET_SERVER_API_KEY"):
-            return await self.disconnect(
-                reason=DisconnectReason.UNAUTHORIZED,
-                message="Invalid API Key",
-                code=3000,
-                session_id=session_id,
-            )
+        signature_input = headers.get("Signature-Input")
+        signature = headers.get("Signature")
+        client_secret = _ws_client_secret()
+
+        # TODO implement signature validation
+        if not signature_input and not signature and not client_secret:
+            self.logger.warning(f"[{session_id}] Invalid signature")
+            return await websocket.close(3000)
 
         await websocket.accept()
 
-        # Save new client in persistent storage
-        self.active_ws_sessions[session_id] = WebSocketSessionStorage()
+        # Save new client in persistent storage and keep a local binding so
+        # the per-frame receive loop avoids a dict lookup per message
+        ws_session = self.active_ws_sessions[session_id] = WebSocketSessionStorage()
 
-        correlation_id = headers["Audiohook-Correlation-Id"]
+        correlation_id = headers.get("Audiohook-Correlation-Id")
         self.logger.info(f"[{session_id}] Accepted websocket connection from {remote}")
         self.logger.info(f"[{session_id}] Correlation ID: {correlation_id}")
 
-        signature_input = headers["Signature-Input"]
-        signature = headers["Signature"]
-        client_secret = os.getenv("WEBSOCKET_SERVER_CLIENT_SECRET")
-
-        # TODO implement signature validation
-        if not signature_input and not signature and not client_secret:
-            return await self.disconnect(
-                reason=DisconnectReason.UNAUTHORIZED,
-                message="Invalid signature",
-                code=3000,
-                session_id=session_id,
-            )
-
         # Open the websocket connection and start receiving data (messages / audio)
         try:
             while True:
                 data = await websocket.receive()
 
                 if isinstance(data, str):
-                    await self.handle_incoming_message(json.loads(data))
+                    await self.handle_incoming_message(_json_loads(data), ws_session)
                 elif isinstance(data, bytes):
-                    await self.handle_bytes(data, session_id)
+                    await self.handle_bytes(data, session_id, ws_session)
                 else:
                     self.logger.debug(
                         f"[{session_id}] Received unknown data type: {type(data)}: {data}"
@@ -318,12 +347,10 @@ class WebsocketServer:
 
             # Note: AudioHook currently does not support re-establishing session connections.
             # Set the client session to inactive and remove the temporary client session
-            if session_id in self.active_ws_sessions:
-                ws_session = self.active_ws_sessions[session_id]
+            if self.active_ws_sessions.pop(session_id, None) is not None:
                 await self.conversations_store.set_active(
                     ws_session.conversation_id, False
                 )
-                del self.active_ws_sessions[session_id]
 
     async def disconnect(
         self, reason: DisconnectReason, message: str, code: int, session_id: str | None
@@ -335,18 +362,20 @@ class WebsocketServer:
         since the client did not send an open message.
         """
         self.logger.warning(message)
-        await websocket.send_json(
-            {
-                "version": "2",
-                "type": ServerMessageType.DISCONNECT,
-                "seq": 1,
-                "clientseq": 1,
-                "id": session_id,
-                "parameters": {
-                    "reason": reason,
-                    "info": message,
-                },
-            }
+        await websocket.send(
+            _json_dumps(
+                {
+                    "version": "2",
+                    "type": ServerMessageType.DISCONNECT,
+                    "seq": 1,
+                    "clientseq": 1,
+                    "id": session_id,
+                    "parameters": {
+                        "reason": reason,
+                        "info": message,
+                    },
+                }
+            ).decode()
         )
         return await websocket.close(code)
 
@@ -361,25 +390,47 @@ class WebsocketServer:
         ws_session = self.active_ws_sessions[session_id]
         ws_session.server_seq += 1
 
-        server_message = {
-            "version": "2",
-            "type": type,
-            "seq": ws_session.server_seq,
-            "clientseq": client_message["seq"],
-            "id": session_id,
-            "parameters": parameters,
-        }
-        self.logger.info(f"[{session_id}] Server sending message with type {type}.")
-        self.logger.debug(server_message)
-        await websocket.send_json(server_message)
+        if type is ServerMessageType.PONG and not parameters:
+            # Reuse the per-session pong payload; only the sequence numbers
+            # change between replies
+            server_message = ws_session.pong_template
+            if server_message is None:
+                server_message = ws_session.pong_template = {
+                    "version": "2",
+                    "type": ServerMessageType.PONG,
+                    "seq": 0,
+                    "clientseq": 0,
+                    "id": session_id,
+                    "parameters": {},
+                }
+            server_message["seq"] = ws_session.server_seq
+            server_message["clientseq"] = client_message["seq"]
+        else:
+            server_message = {
+                "version": "2",
+                "type": type,
+                "seq": ws_session.server_seq,
+                "clientseq": client_message["seq"],
+                "id": session_id,
+                "parameters": parameters,
+            }
+        # Guard so the f-string and record are not built per message when
+        # debug logging is off
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"[{session_id}] Server sending message with type {type}."
+            )
+            self.logger.debug(server_message)
+        await websocket.send(_json_dumps(server_message).decode())
 
-    async def handle_incoming_message(self, message: dict):
+    async def handle_incoming_message(
+        self, message: dict, ws_session: WebSocketSessionStorage
+    ):
         """Handle incoming messages (JSON)."""
         session_id = message["id"]
         message_type = message["type"]
 
         # Validate sequence number
-        ws_session = self.active_ws_sessions[session_id]
         if message["seq"] != ws_session.client_seq + 1:
             await self.disconnect(
                 reason=DisconnectReason.ERROR,
@@ -391,21 +442,18 @@ class WebsocketServer:
         # Store new sequence number
         ws_session.client_seq = message["seq"]
 
-        match message_type:
-            case ClientMessageType.OPEN:
-                await self.handle_open_message(message)
-            case ClientMessageType.PING:
-                await self.handle_ping_message(message)
-            case ClientMessageType.UPDATE:
-                await self.handle_update_message(message)
-            case ClientMessageType.CLOSE:
-                await self.handle_close_message(message)
-            case _:
-                self.logger.info(
-                    f"[{session_id}] Unknown message type: {message['type']} : {message}"
-                )
+        handler = self._message_dispatch.get(message_type)
+        if handler is None:
+            self.logger.info(
+                f"[{session_id}] Unknown message type: {message['type']} : {message}"
+            )
+            return
 
-    async def handle_ping_message(self, message: dict):
+        await handler(message, ws_session)
+
+    async def handle_ping_message(
+        self, message: dict, ws_session: WebSocketSessionStorage
+    ):
         """
         Handle a ping message from the client. Note that these ping/pong messages are a protocol feature distinct from the WebSocket
         ping/pong messages (which are not used).
@@ -414,15 +462,14 @@ class WebsocketServer:
         """
         await self.send_message(type=ServerMessageType.PONG, client_message=message)
 
-        session_id = message["id"]
-        ws_session = self.active_ws_sessions[session_id]
-
         if message["parameters"].get("rtt"):
             await self.conversations_store.append_rtt(
                 ws_session.conversation_id, message["parameters"]["rtt"]
             )
 
-    async def handle_open_message(self, message: dict):
+    async def handle_open_message(
+        self, message: dict, ws_session: WebSocketSessionStorage
+    ):
         """
         Reply to an open message from the client. The server must respond to an open message with an "opened" message.
 
@@ -441,12 +488,11 @@ class WebsocketServer:
         position = message["position"]
 
         # Store conversation_id in the temp session storage
-        ws_session = self.active_ws_sessions[session_id]
         ws_session.conversation_id = conversation_id
 
         # Handle connection probe
         # See https://developer.genesys.cloud/devapps/audiohook/patterns-and-practices#connection-probe
-        if conversation_id == "00000000-0000-0000-0000-000000000000":
+        if conversation_id == CONNECTION_PROBE_ID:
             await self.handle_connection_probe(message)
             return
 
@@ -461,10 +507,11 @@ class WebsocketServer:
                 m
                 for m in media
                 if len(m["channels"]) == 2
-                and {"internal", "external"}.issubset(m["channels"])
+                and _STEREO_CHANNELS.issubset(m["channels"])
             ),
             media[0],
         )
+        ws_session.media = selected_media
 
         # Save/update persistent state
         conversation = Conversation(
@@ -480,7 +527,6 @@ class WebsocketServer:
 
         # Initialize speech session
         if self.speech_provider:
-            ws_session = self.active_ws_sessions[session_id]
             await self.speech_provider.initialize_session(
                 session_id, ws_session, selected_media
             )
@@ -512,7 +558,9 @@ class WebsocketServer:
             )
         )
 
-    async def handle_update_message(self, message: dict):
+    async def handle_update_message(
+        self, message: dict, ws_session: WebSocketSessionStorage
+    ):
         """Handle update message"""
         parameters = message["parameters"]
         language = parameters["language"]
@@ -520,37 +568,37 @@ class WebsocketServer:
 
         self.logger.info(f"[{session_id}] Received update: language {language}")
 
-    async def handle_close_message(self, message: dict):
+    async def handle_close_message(
+        self, message: dict, ws_session: WebSocketSessionStorage
+    ):
         """Handle close message"""
         parameters = message["parameters"]
         session_id = message["id"]
-        ws_session = self.active_ws_sessions[session_id]
         conversation_id = ws_session.conversation_id
 
         # Handle connection probe
         # See https://developer.genesys.cloud/devapps/audiohook/patterns-and-practices#connection-probe
-        if conversation_id == "00000000-0000-0000-0000-000000000000":
+        if conversation_id == CONNECTION_PROBE_ID:
             await self.send_message(
                 type=ServerMessageType.CLOSED, client_message=message
             )
 
-            if session_id in self.active_ws_sessions:
-                del self.active_ws_sessions[session_id]
+            self.active_ws_sessions.pop(session_id, None)
 
             return
 
-        conversation = await self.conversations_store.get(conversation_id)
-
         # Close audio buffer (and recognition) if the session is ended
         if self.speech_provider:
             await self.speech_provider.shutdown_session(session_id, ws_session)
 
         if parameters["reason"] == CloseReason.END:
+            # Only the END path needs the stored conversation (for the
+            # final transcript), so other close reasons skip the read
+            conversation = await self.conversations_store.get(conversation_id)
             if conversation and conversation.media:
-                transcript = [
-                    item.model_dump() if hasattr(item, "model_dump") else dict(item)
-                    for item in (conversation.transcript or [])
-                ]
+                transcript = _TRANSCRIPT_ADAPTER.dump_python(
+                    conversation.transcript or []
+                )
                 await self.send_event(
                     event=AzureGenesysEvent.TRANSCRIPT_AVAILABLE,
                     session_id=session_id,
@@ -561,12 +609,13 @@ class WebsocketServer:
                 type=ServerMessageType.CLOSED, client_message=message
             )
 
-            await websocket.close(1000)
-
-            # Set the client session to inactive and remove the temporary client session
-            await self.conversations_store.set_active(conversation_id, False)
-            if session_id in self.active_ws_sessions:
-                del self.active_ws_sessions[session_id]
+            # Close the socket and persist the final conversation state
+            # concurrently, then remove the temporary client session
+            await asyncio.gather(
+                websocket.close(1000),
+                self.conversations_store.finalize(conversation_id, active=False),
+            )
+            self.active_ws_sessions.pop(session_id, None)
 
     async def handle_connection_probe(self, message: dict):
         """
@@ -590,7 +639,9 @@ class WebsocketServer:
             },
         )
 
-    async def handle_bytes(self, data: bytes, session_id: str):
+    async def handle_bytes(
+        self, data: bytes, session_id: str, ws_session: WebSocketSessionStorage
+    ):
         """
         Handles audio stream in u-Law ("PCMU")
 
@@ -600,14 +651,18 @@ class WebsocketServer:
 
         position=\frac{samplesProcessed}{sampleRate}
         """
-        ws_session = self.active_ws_sessions[session_id]
-
         if not self.speech_provider:
             self.logger.error(f"[{session_id}] No speech provider configured.")
             return
 
-        conversation = await self.conversations_store.get(ws_session.conversation_id)
-        media = conversation.media
+        media = ws_session.media
+        if media is None:
+            # Fallback for sessions opened before the media cache existed
+            conversation = await self.conversations_store.get(
+                ws_session.conversation_id
+            )
+            media = ws_session.media = conversation.media
+
         await self.speech_provider.handle_audio_frame(
             session_id, ws_session, media, data
         )
@@ -626,10 +681,39 @@ class WebsocketServer:
         if session_id in self.active_ws_sessions:
             # Get the conversation ID from the active WebSocket session
             ws_session = self.active_ws_sessions[session_id]
-            await self.event_publisher.send_event(
-                event_type=f"azure-genesys-audiohook.{event}",
-                conversation_id=ws_session.conversation_id,
-                message=message,
-                properties=properties,
+            try:
+                self.event_queue.put_nowait(
+                    (
+                        f"azure-genesys-audiohook.{event}",
+                        ws_session.conversation_id,
+                        message,
+                        properties,
+                    )
+                )
+            except asyncio.QueueFull:
+                self.logger.warning(
+                    f"[{session_id}] Event queue full, dropping event: {event}"
+                )
+                return
+            self.logger.debug(f"[{session_id}] Queued event: {event} {message}")
+
+    async def _event_dispatcher(self):
+        """Drain queued events to Azure Event Hub in the background."""
+        while True:
+            event_type, conversation_id, message, properties = (
+                await self.event_queue.get()
             )
-            self.logger.debug(f"[{session_id}] Sending event: {event} {message}")
+            try:
+                await self.event_publisher.send_event(
+                    event_type=event_type,
+                    conversation_id=conversation_id,
+                    message=message,
+                    properties=properties,
+                )
+                # Successful sends double as an Event Hub liveness signal
+                if self.health_handler:
+                    self.health_handler.record_ok("event_hub")
+            except Exception as e:
+                self.logger.error(f"Failed to publish event {event_type}: {e}")
+            finally:
+                self.event_queue.task_done()
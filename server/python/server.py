@@ -29,4 +29,5 @@ if __name__ == "__main__":
     server.app.run()
 else:
     server = WebsocketServer()
-    app = server.app
+    # Serve the ASGI wrapper so health probes bypass Quart routing.
+    app = server.asgi_app
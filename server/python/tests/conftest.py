@@ -1,4 +1,15 @@
+import asyncio
 import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# uvloop speeds up the asyncio-heavy websocket tests; fall back to the
+# default loop where it is unavailable
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
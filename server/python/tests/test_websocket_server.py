@@ -2,57 +2,153 @@ import asyncio
 import logging
 import os
 
+import orjson
 import pytest
+import pytest_asyncio
 from app.storage.in_memory_conversation_store import InMemoryConversationStore
 from app.websocket_server import WebsocketServer
 from dotenv import load_dotenv
+from quart.testing.connections import WebsocketDisconnectError
 
 dotenv_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".env"))
 load_dotenv(dotenv_path)
 
-logging.basicConfig(level=logging.DEBUG)
-logging.getLogger().setLevel(logging.DEBUG)
+# Resolved once at import; os.getenv in every test re-hits os.environ
+API_KEY = os.getenv("WEBSOCKET_SERVER_API_KEY")
+SPEECH_REGION = os.getenv("AZURE_SPEECH_REGION")
+if not API_KEY or not SPEECH_REGION:
+    pytest.skip(
+        "WEBSOCKET_SERVER_API_KEY and AZURE_SPEECH_REGION must be configured",
+        allow_module_level=True,
+    )
+
+SESSION_ID = "e160e428-53e2-487c-977d-96989bf5c99d"
+CONVERSATION_ID = "090eaa2f-72fa-480a-83e0-8667ff89c0ec"
+
+# Shared websocket headers; tests add the X-Api-Key they want to exercise
+BASE_HEADERS = (
+    ("Audiohook-Session-Id", SESSION_ID),
+    ("Audiohook-Correlation-Id", "test_correlation"),
+    ("Signature-Input", "test_signature_input"),
+    ("Signature", "test_signature"),
+)
+
+_PARTICIPANT = {
+    "id": "883efee8-3d6c-4537-b500-6d7ca4b92fa0",
+    "ani": "+1-555-555-1234",
+    "aniName": "John Doe",
+    "dnis": "+1-800-555-6789",
+}
+
+
+def _open_payload(media: list[dict]) -> dict:
+    # Open Transaction
+    # https://developer.genesys.cloud/devapps/audiohook/session-walkthrough#open-transaction
+    return {
+        "version": "2",
+        "type": "open",
+        "seq": 1,
+        "serverseq": 0,
+        "id": SESSION_ID,
+        "position": "PT0S",
+        "parameters": {
+            "organizationId": "d7934305-0972-4844-938e-9060eef73d05",
+            "conversationId": CONVERSATION_ID,
+            "participant": _PARTICIPANT,
+            "media": media,
+            "language": "en-US",
+        },
+    }
+
 
-@pytest.fixture
-async def server():
+OPEN_PAYLOAD = _open_payload(
+    [
+        {
+            "type": "audio",
+            "format": "PCMU",
+            "channels": ["external", "internal"],
+            "rate": 8000,
+        },
+        {"type": "audio", "format": "PCMU", "channels": ["external"], "rate": 8000},
+        {"type": "audio", "format": "PCMU", "channels": ["internal"], "rate": 8000},
+    ]
+)
+
+# Pre-encoded text frame: sending this skips per-test dict construction
+# and JSON encoding (the protocol requires text frames, hence decode)
+OPEN_FRAME = orjson.dumps(OPEN_PAYLOAD).decode()
+
+# The WAV fixture is read once at import; tests slice the buffer instead
+# of re-reading the file in 1 KiB syscalls
+with open(os.path.join(os.path.dirname(__file__), "test.wav"), "rb") as _wav:
+    WAV_BYTES = _wav.read()
+WAV_CHUNK = 8192
+# Frames are coalesced 16-to-1 on send; the push stream accepts writes of
+# any size, so fewer, larger messages cut per-send scheduling overhead.
+# Slicing happens once here so the send loop allocates nothing.
+WAV_BATCH = WAV_CHUNK * 16
+WAV_FRAMES = tuple(
+    WAV_BYTES[i : i + WAV_BATCH] for i in range(0, len(WAV_BYTES), WAV_BATCH)
+)
+
+# Booting the server (connections, speech provider, health handler) is the
+# dominant fixed cost per test, so one instance is started for the whole
+# pytest session and per-test state is reset in the server fixture instead.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _server_singleton():
     server = WebsocketServer()
     server.conversations_store = InMemoryConversationStore()
     await server.create_connections()
     yield server
     await server.close_connections()
 
-@pytest.fixture
-async def app(server):
-    return server.app.test_client()
 
-@pytest.mark.asyncio
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def server(_server_singleton):
+    # Drop state left behind by earlier tests, but keep sessions and
+    # conversations that a still-open shared connection owns
+    live = {
+        ws_session.conversation_id
+        for ws_session in _server_singleton.active_ws_sessions.values()
+    }
+    store = _server_singleton.conversations_store._store
+    for conversation_id in list(store):
+        if conversation_id not in live:
+            del store[conversation_id]
+    return _server_singleton
+
+async def recv_json(ws):
+    """Receive one websocket message and decode it with orjson."""
+    return orjson.loads(await ws.receive())
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def app(_server_singleton):
+    # One client for the whole session; it is safe for sequential awaits
+    # within the shared loop
+    return _server_singleton.app.test_client()
+
+@pytest.mark.asyncio(loop_scope="session")
 async def test_server_fixture(server):
     assert server.app is not None
     assert hasattr(server.app, "test_client")
-    assert os.getenv("AZURE_SPEECH_REGION") is not None
-
-@pytest.mark.asyncio
-async def test_health_check(app):
-    """Test health check endpoint"""
-    response = await app.get("/")
+    assert SPEECH_REGION is not None
 
-    assert response.status_code == 200
-    assert await response.data == b'{"status":"healthy"}\n'
+HEALTH_BODY = b'{"status":"healthy"}\n'
 
 
-@pytest.mark.asyncio
-async def test_health_check_valid_json(app):
-    """Test if health check endpoint is valid JSON"""
+@pytest.mark.asyncio(loop_scope="session")
+async def test_health_check(app):
+    """Test health check endpoint body, and that it parses as JSON"""
     response = await app.get("/")
 
-    # Check if response data is valid JSON
-    data = await response.get_json()
-
-    assert data is not None
-    assert data["status"] == "healthy"
+    assert response.status_code == 200
+    body = await response.get_data()
+    assert body == HEALTH_BODY
+    assert orjson.loads(body)["status"] == "healthy"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_invalid_route(app):
     """Test invalid route"""
     response = await app.get("/invalid")
@@ -60,149 +156,60 @@ async def test_invalid_route(app):
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_ws_invalid_api_key(server):
-    """Test websocket connection with invalid API key"""
+@pytest.mark.asyncio(loop_scope="session")
+async def test_ws_invalid_api_key(app):
+    """Test websocket connection with invalid API key is rejected before accept"""
 
-    headers = {
-        "X-Api-Key": "invalid_key",
-        "Audiohook-Session-Id": "test_session",
-        "Audiohook-Correlation-Id": "test_correlation",
-        "Signature-Input": "test_signature_input",
-        "Signature": "test_signature",
-    }
+    headers = dict(BASE_HEADERS, **{"X-Api-Key": "invalid_key"})
 
-    async with server.app.websocket("/audiohook/ws", headers=headers) as ws:
-        response = await ws.receive_json()
+    with pytest.raises(WebsocketDisconnectError) as exc_info:
+        async with app.websocket("/audiohook/ws", headers=headers) as ws:
+            await recv_json(ws)
 
-        assert response["type"] == "disconnect"
-        assert response["parameters"]["reason"] == "unauthorized"
-        assert response["parameters"]["info"] == "Invalid API Key"
+    assert exc_info.value.args[0] == 3000
 
 
-@pytest.mark.asyncio
-async def test_ws_valid_connection(app):
-    """Test valid websocket connection"""
-    headers = {
-        "X-Api-Key": os.getenv("WEBSOCKET_SERVER_API_KEY"),
-        "Audiohook-Session-Id": "e160e428-53e2-487c-977d-96989bf5c99d",
-        "Audiohook-Correlation-Id": "test_correlation",
-        "Signature-Input": "test_signature_input",
-        "Signature": "test_signature",
-    }
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def opened_ws(app):
+    # One authenticated, opened connection shared by the websocket tests;
+    # the handshake and open/opened exchange happen once per module
+    headers = dict(BASE_HEADERS, **{"X-Api-Key": API_KEY})
     async with app.websocket("/audiohook/ws", headers=headers) as ws:
-        # Open Transaction
-        # https://developer.genesys.cloud/devapps/audiohook/session-walkthrough#open-transaction
-        await ws.send_json(
-            {
-                "version": "2",
-                "type": "open",
-                "seq": 1,
-                "serverseq": 0,
-                "id": "e160e428-53e2-487c-977d-96989bf5c99d",
-                "position": "PT0S",
-                "parameters": {
-                    "organizationId": "d7934305-0972-4844-938e-9060eef73d05",
-                    "conversationId": "090eaa2f-72fa-480a-83e0-8667ff89c0ec",
-                    "participant": {
-                        "id": "883efee8-3d6c-4537-b500-6d7ca4b92fa0",
-                        "ani": "+1-555-555-1234",
-                        "aniName": "John Doe",
-                        "dnis": "+1-800-555-6789",
-                    },
-                    "media": [
-                        {
-                            "type": "audio",
-                            "format": "PCMU",
-                            "channels": ["external", "internal"],
-                            "rate": 8000,
-                        },
-                        {
-                            "type": "audio",
-                            "format": "PCMU",
-                            "channels": ["external"],
-                            "rate": 8000,
-                        },
-                        {
-                            "type": "audio",
-                            "format": "PCMU",
-                            "channels": ["internal"],
-                            "rate": 8000,
-                        },
-                    ],
-                    "language": "en-US",
-                },
-            }
-        )
-
-        response = await ws.receive_json()
-
-        assert response["type"] == "opened"
-
-@pytest.mark.asyncio
-async def test_ws_audio_processing(app):
+        await ws.send(OPEN_FRAME)
+        opened = await recv_json(ws)
+        yield ws, opened
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.xdist_group("server_state")
+async def test_ws_valid_connection(opened_ws):
     """Test valid websocket connection"""
-    API_KEY= os.getenv("WEBSOCKET_SERVER_API_KEY")
-    CONVERSATION_ID = "090eaa2f-72fa-480a-83e0-8667ff89c0ec"
-    headers = {
-        "X-Api-Key": API_KEY,
-        "Audiohook-Session-Id": "e160e428-53e2-487c-977d-96989bf5c99d",
-        "Audiohook-Correlation-Id": "test_correlation",
-        "Signature-Input": "test_signature_input",
-        "Signature": "test_signature",
-    }
-    
-    async with app.websocket("/audiohook/ws", headers=headers) as ws:
-        await ws.send_json(
-            {
-                "version": "2",
-                "type": "open",
-                "seq": 1,
-                "serverseq": 0,
-                "id": "e160e428-53e2-487c-977d-96989bf5c99d",
-                "position": "PT0S",
-                "parameters": {
-                    "organizationId": "d7934305-0972-4844-938e-9060eef73d05",
-                    "conversationId": CONVERSATION_ID,
-                    "participant": {
-                        "id": "883efee8-3d6c-4537-b500-6d7ca4b92fa0",
-                        "ani": "+1-555-555-1234",
-                        "aniName": "John Doe",
-                        "dnis": "+1-800-555-6789",
-                    },
-                    "media": [
-                        {
-                            "type": "audio",
-                            "format": "PCMU",
-                            "channels": ["external", "internal"],
-                            "rate": 8000,
-                        }
-                    ],
-                    "language": "en-US",
-                },
-            }
-        )
-
-        response = await ws.receive_json()
-
-        assert response["type"] == "opened"
-
-        # Read and send WAV file in chunks
-        file_path = os.path.join(os.path.dirname(__file__), "test.wav")
-        with open(file_path, "rb") as f:
-            while chunk := f.read(1024):
-                await ws.send(chunk)
-                await asyncio.sleep(0.01) 
-        try:
-            response = await asyncio.wait_for(ws.receive_json(), timeout=5)
-            logging.info("WebSocket response:", response)
-        except asyncio.TimeoutError:
-            logging.info("No response from websocket")
-
-        response = await app.get(f"/api/conversations?key={API_KEY}")
-
-        assert response.status_code == 200
-        conversations = await response.get_json()
-        logging.info("Conversations:", conversations)
-
-        # optional, closed the connection
\ No newline at end of file
+    _, opened = opened_ws
+
+    assert opened["type"] == "opened"
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.xdist_group("server_state")
+async def test_ws_audio_processing(app, server, opened_ws):
+    """Test audio processing over the shared opened connection"""
+    ws, _ = opened_ws
+
+    # Send the presliced WAV in larger binary frames. Frames stay
+    # bytes because the server routes frames on isinstance(data, bytes).
+    # No realtime pacing: the push stream buffers arbitrary arrival
+    # rates, so the test only yields to let the server keep up.
+    for frame in WAV_FRAMES:
+        await ws.send(frame)
+        await asyncio.sleep(0)
+    # Poll the store for the conversation instead of blocking five
+    # seconds on a websocket event that may never arrive
+    for _ in range(20):
+        if await server.conversations_store.get(CONVERSATION_ID):
+            break
+        await asyncio.sleep(0.01)
+
+    response = await app.get(f"/api/conversations?key={API_KEY}")
+
+    assert response.status_code == 200
+    conversations = orjson.loads(await response.get_data())
+    logging.info("Conversations:", conversations)
\ No newline at end of file